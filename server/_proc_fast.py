@@ -0,0 +1,141 @@
+"""Linux fast path for process listing that reads /proc directly instead of going through psutil."""
+from __future__ import annotations
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+import functools
+import os
+import sys
+import time
+
+# Only usable where procfs is mounted; callers fall back to psutil otherwise
+AVAILABLE = sys.platform.startswith("linux") and os.path.isdir("/proc")
+
+if AVAILABLE:
+    import pwd
+
+    _CLK_TCK = os.sysconf("SC_CLK_TCK")
+    _PAGE_SIZE = os.sysconf("SC_PAGE_SIZE")
+
+# The kernel truncates comm in /proc/<pid>/stat to this many characters
+_COMM_LEN = 15
+
+# Errors meaning a process vanished, is unreadable, or returned a malformed record
+_READ_ERRORS = (OSError, ValueError, IndexError)
+
+
+def _parse_stat(data: bytes) -> Tuple[str, int, int]:
+    """Parse a /proc/<pid>/stat record into (comm, utime + stime ticks, rss pages).
+
+    comm may itself contain spaces and parentheses, so fields are split after the rightmost ')'.
+    """
+    rpar = data.rindex(b")")
+    comm = os.fsdecode(data[data.index(b"(") + 1:rpar])
+    # fields[0] is stat field 3 (state); utime=14, stime=15, rss=24
+    fields = data[rpar + 2:].split()
+    return comm, int(fields[11]) + int(fields[12]), int(fields[21])
+
+
+def _read_stat(pid: int) -> Tuple[str, int, int]:
+    """Read and parse /proc/<pid>/stat in a single read."""
+    with open(f"/proc/{pid}/stat", "rb") as f:
+        return _parse_stat(f.read())
+
+
+def _read_uid(pid: int) -> int:
+    """Read the real uid of a process from /proc/<pid>/status."""
+    with open(f"/proc/{pid}/status", "rb") as f:
+        data = f.read()
+    # Uid: real, effective, saved, filesystem
+    return int(data.split(b"\nUid:", 1)[1].split(None, 1)[0])
+
+
+@functools.lru_cache(maxsize=256)
+def _username(uid: int) -> str:
+    """Resolve a uid to a user name, falling back to the numeric uid like psutil."""
+    try:
+        return pwd.getpwuid(uid).pw_name
+    except KeyError:
+        return str(uid)
+
+
+def read_cmdline(pid: int) -> Optional[List[str]]:
+    """Read a process's argv from /proc, or None if it is gone or unreadable."""
+    try:
+        with open(f"/proc/{pid}/cmdline", "rb") as f:
+            data = f.read()
+    except OSError:
+        return None
+    if not data:
+        return []
+    return [os.fsdecode(arg) for arg in data.rstrip(b"\0").split(b"\0")]
+
+
+def _full_name(pid: int, comm: str) -> str:
+    """Recover a name truncated by the kernel from argv[0], as psutil does."""
+    if len(comm) < _COMM_LEN:
+        return comm
+    cmdline = read_cmdline(pid)
+    if cmdline:
+        exe_name = os.path.basename(cmdline[0])
+        if exe_name.startswith(comm):
+            return exe_name
+    return comm
+
+
+def iter_processes(
+    interval: float = 0.2,
+    name_filter_lower: Optional[str] = None,
+    user_filter: Optional[str] = None
+) -> Iterator[Tuple[Dict[str, Any], Callable[[], Optional[List[str]]]]]:
+    """Measure all processes from two /proc snapshots taken ``interval`` seconds apart.
+
+    Yields the same fields as the psutil path in process_tools, each paired with a
+    callable that reads the command line only when the caller needs it.
+
+    Args:
+        interval: Seconds between the two CPU snapshots
+        name_filter_lower: Lowercased substring the process name must contain
+        user_filter: Username the process must belong to
+    """
+    # First snapshot: CPU ticks and read time per process, filtering by name before any further reads
+    before: Dict[int, Tuple[str, int, float]] = {}
+    for entry in os.listdir("/proc"):
+        if not entry.isdigit():
+            continue
+        pid = int(entry)
+        try:
+            comm, ticks, _ = _read_stat(pid)
+        except _READ_ERRORS:
+            continue
+        read_at = time.monotonic()
+        name = _full_name(pid, comm)
+        if name_filter_lower and name_filter_lower not in name.lower():
+            continue
+        before[pid] = (name, ticks, read_at)
+
+    time.sleep(interval)
+
+    total_mem = os.sysconf("SC_PHYS_PAGES") * _PAGE_SIZE
+
+    # Second snapshot: CPU delta, resident memory and owner
+    for pid, (name, ticks_before, read_at) in before.items():
+        try:
+            _, ticks, rss_pages = _read_stat(pid)
+            # Time each process over its own pair of reads, as psutil does
+            elapsed = time.monotonic() - read_at
+            username = _username(_read_uid(pid))
+        except _READ_ERRORS:
+            continue
+        if user_filter and username != user_filter:
+            continue
+
+        rss = rss_pages * _PAGE_SIZE
+        cpu_seconds = max(ticks - ticks_before, 0) / _CLK_TCK
+        info = {
+            "pid": pid,
+            "name": name,
+            "username": username,
+            "cpu_percent": round(cpu_seconds / elapsed * 100, 1),
+            "memory_percent": (rss * 100.0) / total_mem,
+            "memory_mb": rss >> 20
+        }
+        yield info, functools.partial(read_cmdline, pid)
@@ -1,6 +1,45 @@
 """Configuration management for system dashboard using environment variables."""
+import functools
 import os
-from typing import List, Set
+from typing import Final, FrozenSet, List, NamedTuple
+
+
+class _EnvSettings(NamedTuple):
+    """Raw settings parsed from the environment."""
+    allowlist: FrozenSet[str]
+    rate_limit_per_min: int
+    summary_top_n: int
+
+
+@functools.lru_cache(maxsize=1)
+def _load_env() -> _EnvSettings:
+    """Parse configuration environment variables once per process."""
+    allowlist_str = os.getenv(
+        "PROCESS_KILL_ALLOWLIST",
+        "python,python3,node,chrome,chromium,firefox,code,slack,discord"
+    )
+    # Entries are stored lowercased; security.py's matchers rely on this
+    allowlist = frozenset(
+        name.strip().lower() for name in allowlist_str.split(",") if name.strip()
+    )
+    
+    # Rate limit for kill operations (per minute)
+    try:
+        rate_limit = int(os.getenv("PROCESS_KILL_RATE_LIMIT_PER_MIN", "2"))
+    except ValueError:
+        rate_limit = 2
+    
+    # Number of top processes to show in summary
+    try:
+        top_n = int(os.getenv("SUMMARY_TOP_N", "3"))
+    except ValueError:
+        top_n = 3
+    
+    return _EnvSettings(allowlist, rate_limit, top_n)
+
+
+# Process names repeat heavily across listings and kill attempts
+_lower_name = functools.lru_cache(maxsize=256)(str.lower)
 
 
 class Config:
@@ -11,30 +50,15 @@ class Config:
         PROCESS_KILL_ALLOWLIST: Comma-separated list of safe process names (default: "python,node,chrome,code")
         PROCESS_KILL_RATE_LIMIT_PER_MIN: Maximum kill operations per minute (default: 2)
         SUMMARY_TOP_N: Number of top processes in system summary (default: 3)
+    
+    The environment is parsed once per process; instances share the cached values.
     """
     
     def __init__(self):
-        allowlist_str = os.getenv(
-            "PROCESS_KILL_ALLOWLIST",
-            "python,python3,node,chrome,chromium,firefox,code,slack,discord"
-        )
-        self.PROCESS_KILL_ALLOWLIST = set(
-            name.strip().lower() for name in allowlist_str.split(",") if name.strip()
-        )
-        
-        # Rate limit for kill operations (per minute)
-        try:
-            self.PROCESS_KILL_RATE_LIMIT_PER_MIN = int(
-                os.getenv("PROCESS_KILL_RATE_LIMIT_PER_MIN", "2")
-            )
-        except ValueError:
-            self.PROCESS_KILL_RATE_LIMIT_PER_MIN = 2
-        
-        # Number of top processes to show in summary
-        try:
-            self.SUMMARY_TOP_N = int(os.getenv("SUMMARY_TOP_N", "3"))
-        except ValueError:
-            self.SUMMARY_TOP_N = 3
+        env = _load_env()
+        self.PROCESS_KILL_ALLOWLIST: FrozenSet[str] = env.allowlist
+        self.PROCESS_KILL_RATE_LIMIT_PER_MIN = env.rate_limit_per_min
+        self.SUMMARY_TOP_N = env.summary_top_n
     
     def is_process_name_safe(self, process_name: str) -> bool:
         """
@@ -48,7 +72,7 @@ class Config:
         """
         if not process_name:
             return False
-        return process_name.lower() in self.PROCESS_KILL_ALLOWLIST
+        return _lower_name(process_name) in self.PROCESS_KILL_ALLOWLIST
     
     def add_to_allowlist(self, process_name: str) -> None:
         """
@@ -58,7 +82,7 @@ class Config:
             process_name: Name of the process to add
         """
         if process_name:
-            self.PROCESS_KILL_ALLOWLIST.add(process_name.lower())
+            self.PROCESS_KILL_ALLOWLIST = self.PROCESS_KILL_ALLOWLIST | {process_name.lower()}
     
     def remove_from_allowlist(self, process_name: str) -> None:
         """
@@ -68,7 +92,7 @@ class Config:
             process_name: Name of the process to remove
         """
         if process_name:
-            self.PROCESS_KILL_ALLOWLIST.discard(process_name.lower())
+            self.PROCESS_KILL_ALLOWLIST = self.PROCESS_KILL_ALLOWLIST - {process_name.lower()}
     
     def get_allowlist(self) -> List[str]:
         """
@@ -87,5 +111,5 @@ class Config:
         )
 
 
-# Global configuration instance
-config = Config()
+# Global configuration instance, resolved once at import
+config: Final[Config] = Config()
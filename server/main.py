@@ -4,9 +4,6 @@ from typing import List, Dict, Any, Optional
 # FIX: Add dots for relative imports
 from .system_tools import get_cpu, get_memory, get_disk, get_network, get_system_summary
 from .process_tools import process_list, process_kill_safe
-from .security import process_is_safe
-from .schema import CPUStats, MemoryStats, DiskStats, NetworkStats, ProcessInfo, SystemSummary
-from .config import config
 
 sysdash = FastMCP(
     name="sysdash",
@@ -1,60 +1,103 @@
 """Process management tools for listing and terminating processes."""
 from __future__ import annotations
-from typing import List, Dict, Any, Optional
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
+import heapq
+import operator
 import psutil
 import time
 
 # FIX: Add dots for relative imports
-from .security import kill_rate_limiter, process_is_safe
-from .config import config
+from . import _proc_fast
+from .security import _check_safe_with_name, kill_rate_limiter
+
+# Cheap identity fields read while priming, used to filter before measuring
+_INFO_ATTRS = ["pid", "name", "username"]
+# Fields read per surviving process in a single as_dict() batch; cmdline is
+# the costliest read and is fetched only for the processes that are returned
+_MEASURE_ATTRS = ["cpu_percent", "memory_info"]
+
+# Public sort names mapped to process dict keys; usage metrics sort descending
+_SORT_KEY_MAP = {
+    "cpu": "cpu_percent",
+    "memory": "memory_percent",
+    "pid": "pid",
+    "name": "name"
+}
+_REVERSE_KEYS = frozenset({"cpu_percent", "memory_percent"})
+
+# Upper bound on a joined command line; pathological argv lists get truncated
+_CMDLINE_MAX_CHARS = 4096
 
 
 def _safe_join_cmdline(cmdline: Optional[List[str]]) -> Optional[str]:
-    """Safely join command line arguments."""
-    if cmdline is None:
+    """Safely join command line arguments, truncating past ``_CMDLINE_MAX_CHARS``."""
+    if not cmdline:
         return None
+    
+    parts = []
+    length = 0
     try:
-        return " ".join(cmdline)
-    except:
+        for arg in cmdline:
+            sep = 1 if parts else 0
+            if length + sep + len(arg) > _CMDLINE_MAX_CHARS:
+                # Spend whatever budget is left after the separator, then mark the cut
+                remaining = max(_CMDLINE_MAX_CHARS - length - sep, 0)
+                if remaining:
+                    parts.append(arg[:remaining])
+                return " ".join(parts) + "..."
+            parts.append(arg)
+            length += sep + len(arg)
+        return " ".join(parts)
+    except TypeError:
         return None
 
 
-def _snapshot_processes() -> List[tuple[psutil.Process, Dict[str, Any]]]:
-    """Take a snapshot of all running processes."""
+def _snapshot_processes() -> List[psutil.Process]:
+    """Prime the CPU counters of all running processes."""
     processes = []
-    for proc in psutil.process_iter(['pid', 'name', 'username']):
+    for proc in psutil.process_iter(_INFO_ATTRS):
         try:
-            info = proc.info
-            processes.append((proc, info))
+            proc.cpu_percent()
+            processes.append(proc)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
     return processes
 
 
-def _measure_after_interval(procs: List[tuple[psutil.Process, Dict[str, Any]]], interval: float = 0.2) -> List[Dict[str, Any]]:
-    """Measure CPU/memory after a brief interval."""
+def _measure_after_interval(
+    procs: List[psutil.Process],
+    interval: float = 0.2,
+    name_filter_lower: Optional[str] = None,
+    user_filter: Optional[str] = None
+) -> Iterator[Tuple[Dict[str, Any], Callable[[], Optional[List[str]]]]]:
+    """Measure CPU/memory after a brief interval, skipping filtered-out processes before any reads.
+    
+    Yields each measurement alongside its process's cmdline reader for follow-up reads.
+    """
     time.sleep(interval)
     
-    result = []
-    for proc, info in procs:
+    # memory_percent() re-reads total RAM per process; read it once instead
+    total_mem = psutil.virtual_memory().total
+    
+    for proc in procs:
+        info = proc.info
+        if name_filter_lower and name_filter_lower not in (info["name"] or "").lower():
+            continue
+        if user_filter and info["username"] != user_filter:
+            continue
+        
         try:
-            cpu_percent = proc.cpu_percent()
-            memory_info = proc.memory_info()
-            cmdline = proc.cmdline()
-            
-            result.append({
-                "pid": info["pid"],
-                "name": info["name"],
-                "username": info["username"],
-                "cpu_percent": cpu_percent,
-                "memory_percent": proc.memory_percent(),
-                "memory_mb": memory_info.rss / (1024 * 1024),
-                "cmdline": _safe_join_cmdline(cmdline)
-            })
+            stats = proc.as_dict(attrs=_MEASURE_ATTRS, ad_value=None)
         except (psutil.NoSuchProcess, psutil.AccessDenied):
             continue
-    
-    return result
+        
+        memory_info = stats.pop("memory_info")
+        if stats["cpu_percent"] is None or memory_info is None:
+            continue
+        
+        stats["memory_percent"] = (memory_info.rss * 100.0) / total_mem
+        stats["memory_mb"] = memory_info.rss >> 20
+        yield {**info, **stats}, proc.cmdline
 
 
 def process_list(
@@ -74,32 +117,40 @@ def process_list(
     Returns:
         List of process information dictionaries
     """
-    # Take snapshot and measure
-    snapshot = _snapshot_processes()
-    processes = _measure_after_interval(snapshot)
+    # Take snapshot and measure, filtering before the per-process reads
+    name_filter_lower = name_contains.lower() if name_contains else None
+    if _proc_fast.AVAILABLE:
+        # Read /proc directly on Linux; psutil covers every other platform
+        processes = _proc_fast.iter_processes(name_filter_lower=name_filter_lower, user_filter=user)
+    else:
+        snapshot = _snapshot_processes()
+        processes = _measure_after_interval(snapshot, name_filter_lower=name_filter_lower, user_filter=user)
     
-    # Apply filters
-    if name_contains:
-        name_lower = name_contains.lower()
-        processes = [p for p in processes if name_lower in p["name"].lower()]
+    # Sort
+    sort_key = _SORT_KEY_MAP.get(sort_by, "cpu_percent")
+    reverse = sort_key in _REVERSE_KEYS
     
-    if user:
-        processes = [p for p in processes if p["username"] == user]
+    # Heap over the dicts themselves so itemgetter stays a C-level key;
+    # cmdline readers are kept aside by pid for the winners
+    cmdline_readers: Dict[int, Callable[[], Optional[List[str]]]] = {}
     
-    # Sort
-    sort_keys = {
-        "cpu": "cpu_percent",
-        "memory": "memory_percent",
-        "pid": "pid",
-        "name": "name"
-    }
-    sort_key = sort_keys.get(sort_by, "cpu_percent")
-    
-    reverse = sort_key in ["cpu_percent", "memory_percent"]
-    processes.sort(key=lambda x: x[sort_key], reverse=reverse)
-    
-    # Limit
-    return processes[:limit]
+    def entries() -> Iterator[Dict[str, Any]]:
+        for info, read_cmdline in processes:
+            cmdline_readers[info["pid"]] = read_cmdline
+            yield info
+    
+    # Select the top entries without sorting the whole list
+    select = heapq.nlargest if reverse else heapq.nsmallest
+    top = select(limit, entries(), key=operator.itemgetter(sort_key))
+    
+    # Read command lines only for the processes being returned
+    for info in top:
+        try:
+            cmdline = cmdline_readers[info["pid"]]()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            cmdline = None
+        info["cmdline"] = _safe_join_cmdline(cmdline)
+    return top
 
 
 def process_kill_safe(
@@ -123,7 +174,7 @@ def process_kill_safe(
     if not kill_rate_limiter.allow():
         return {
             "ok": False,
-            "message": f"Rate limit exceeded. Max {config.PROCESS_KILL_RATE_LIMIT_PER_MIN} kills per minute."
+            "message": f"Rate limit exceeded. Max {kill_rate_limiter.max_per_minute} kills per minute."
         }
     
     # Check if process exists
@@ -135,8 +186,8 @@ def process_kill_safe(
     except psutil.AccessDenied:
         return {"ok": False, "message": f"Access denied to process {pid}"}
     
-    # Safety check
-    safety_check = process_is_safe(pid, require_allowlist=not unsafe)
+    # Safety check, reusing the name already read above
+    safety_check = _check_safe_with_name(proc_name, require_allowlist=not unsafe)
     
     if not safety_check["is_safe"]:
         if not confirm or not unsafe:
@@ -1,43 +1,81 @@
 from __future__ import annotations
+from dataclasses import dataclass
 from typing import List, Optional
 from pydantic import BaseModel, Field
 
 
-class CPUStats(BaseModel):
+# Telemetry records are plain dataclasses: they are built per tool call and
+# only need range checks while debugging. Pydantic is kept for request models.
+
+def _check_range(name: str, value: float, upper: Optional[float] = None) -> None:
+    """Validate a numeric field is non-negative and at most ``upper`` (only called under ``__debug__``)."""
+    if value < 0 or (upper is not None and value > upper):
+        raise ValueError(f"{name} out of range: {value}")
+
+
+@dataclass(frozen=True, slots=True)
+class CPUStats:
     """CPU utilization statistics."""
-    overall: float = Field(..., ge=0, le=100, description="Overall CPU usage percentage")
-    per_core: List[float] = Field(..., description="Per-core CPU usage percentages")
+    overall: float  # Overall CPU usage percentage
+    per_core: List[float]  # Per-core CPU usage percentages
+
+    def __post_init__(self) -> None:
+        if __debug__:
+            _check_range("overall", self.overall, upper=100)
 
 
-class MemoryStats(BaseModel):
+@dataclass(frozen=True, slots=True)
+class MemoryStats:
     """Memory usage statistics."""
-    total: int = Field(..., description="Total memory in bytes")
-    used: int = Field(..., description="Used memory in bytes")
-    percent: float = Field(..., ge=0, le=100, description="Memory usage percentage")
+    total: int  # Total memory in bytes
+    used: int  # Used memory in bytes
+    percent: float  # Memory usage percentage
 
+    def __post_init__(self) -> None:
+        if __debug__:
+            _check_range("percent", self.percent, upper=100)
 
-class DiskStats(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class DiskStats:
     """Disk usage statistics for a mount point."""
-    mount: str = Field(..., description="Mount point path")
-    total: int = Field(..., description="Total disk space in bytes")
-    used: int = Field(..., description="Used disk space in bytes")
-    percent: float = Field(..., ge=0, le=100, description="Disk usage percentage")
+    mount: str  # Mount point path
+    total: int  # Total disk space in bytes
+    used: int  # Used disk space in bytes
+    percent: float  # Disk usage percentage
+
+    def __post_init__(self) -> None:
+        if __debug__:
+            _check_range("percent", self.percent, upper=100)
 
 
-class NetworkStats(BaseModel):
+@dataclass(frozen=True, slots=True)
+class NetworkStats:
     """Network I/O statistics."""
-    bytes_sent: int = Field(..., ge=0, description="Total bytes sent")
-    bytes_recv: int = Field(..., ge=0, description="Total bytes received")
+    bytes_sent: int  # Total bytes sent
+    bytes_recv: int  # Total bytes received
 
+    def __post_init__(self) -> None:
+        if __debug__:
+            _check_range("bytes_sent", self.bytes_sent)
+            _check_range("bytes_recv", self.bytes_recv)
 
-class ProcessInfo(BaseModel):
+
+@dataclass(frozen=True, slots=True)
+class ProcessInfo:
     """Information about a running process."""
-    pid: int = Field(..., description="Process ID")
-    name: str = Field(..., description="Process name")
-    username: Optional[str] = Field(None, description="Username running the process")
-    cpu_percent: float = Field(..., ge=0, description="CPU usage percentage")
-    memory_percent: float = Field(..., ge=0, description="Memory usage percentage")
-    cmdline: Optional[str] = Field(None, description="Command line arguments")
+    pid: int  # Process ID
+    name: str  # Process name
+    cpu_percent: float  # CPU usage percentage
+    memory_percent: float  # Memory usage percentage
+    username: Optional[str] = None  # Username running the process
+    cmdline: Optional[str] = None  # Command line arguments
+
+    def __post_init__(self) -> None:
+        if __debug__:
+            _check_range("cpu_percent", self.cpu_percent)
+            _check_range("memory_percent", self.memory_percent)
+
 
 class ProcessListRequest(BaseModel):
     """Request parameters for listing processes."""
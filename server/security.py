@@ -1,38 +1,82 @@
 """Security utilities for process management: rate limiting and safety checks."""
 from __future__ import annotations
-from collections import deque
-from typing import Deque, Dict, Any
+from typing import Callable, Dict, Any, FrozenSet, List
+import functools
+import re
 import time
 import psutil
 
+try:
+    import ahocorasick
+except ImportError:  # optional speedup, fall back to a compiled regex
+    ahocorasick = None
+
 from .config import config
 
 
 class RateLimiter:
-    """Simple token bucket rate limiter."""
+    """Sliding-window rate limiter backed by a fixed-size ring of timestamps."""
     
     def __init__(self, max_per_minute: int):
         self.max_per_minute = max_per_minute
-        self.timestamps: Deque[float] = deque()
+        # Oldest recorded action sits at _idx; -inf marks unused slots
+        self._ring: List[float] = [float("-inf")] * max(max_per_minute, 0)
+        self._idx = 0
     
     def allow(self) -> bool:
         """Check if an action is allowed under the rate limit."""
-        now = time.time()
-        cutoff = now - 60  # 1 minute ago
+        if not self._ring:
+            return False
         
-        # Remove old timestamps
-        while self.timestamps and self.timestamps[0] < cutoff:
-            self.timestamps.popleft()
+        now = time.monotonic()
         
-        # Check limit
-        if len(self.timestamps) >= self.max_per_minute:
+        # The slot we would overwrite holds the oldest action in the window
+        if now - self._ring[self._idx] < 60.0:
             return False
         
         # Record this action
-        self.timestamps.append(now)
+        self._ring[self._idx] = now
+        self._idx = (self._idx + 1) % len(self._ring)
         return True
 
 
+@functools.lru_cache(maxsize=1)
+def _allowlist_matcher(allowlist: FrozenSet[str]) -> Callable[[str], bool]:
+    """Build a single-pass substring matcher for the (already lowercased) allowlist.
+    
+    Keyed on the allowlist itself so runtime allowlist edits rebuild the matcher.
+    """
+    if not allowlist:
+        return lambda name: False
+    
+    if ahocorasick is not None:
+        automaton = ahocorasick.Automaton()
+        for allowed in allowlist:
+            automaton.add_word(allowed, allowed)
+        automaton.make_automaton()
+        return lambda name: next(automaton.iter(name), None) is not None
+    
+    pattern = re.compile("|".join(map(re.escape, allowlist)))
+    return lambda name: pattern.search(name) is not None
+
+
+def _check_safe_with_name(proc_name: str, require_allowlist: bool = True) -> Dict[str, Any]:
+    """Check an already-resolved process name against the allowlist.
+    
+    Lets callers holding a ``psutil.Process`` skip re-opening it by pid.
+    """
+    proc_name = proc_name.lower()
+    
+    if not require_allowlist:
+        return {"is_safe": True, "reason": "Allowlist check bypassed"}
+    
+    # Check if process name contains any allowlisted name
+    if _allowlist_matcher(config.PROCESS_KILL_ALLOWLIST)(proc_name):
+        return {"is_safe": True, "reason": f"Process '{proc_name}' is allowlisted"}
+    
+    return {"is_safe": False, "reason": f"Process '{proc_name}' not in allowlist"}
+
+
 def process_is_safe(pid: int, require_allowlist: bool = True) -> Dict[str, Any]:
     """Check if a process is safe to kill based on allowlist.
     
@@ -44,24 +88,17 @@ def process_is_safe(pid: int, require_allowlist: bool = True) -> Dict[str, Any]:
         Dictionary with 'is_safe' boolean and 'reason' string
     """
     try:
-        proc = psutil.Process(pid)
-        proc_name = proc.name().lower()
-        
-        if not require_allowlist:
-            return {"is_safe": True, "reason": "Allowlist check bypassed"}
-        
-        # Check if process name is in allowlist
-        for allowed in config.PROCESS_KILL_ALLOWLIST:
-            if allowed.lower() in proc_name:
-                return {"is_safe": True, "reason": f"Process '{proc_name}' is allowlisted"}
-        
-        return {"is_safe": False, "reason": f"Process '{proc_name}' not in allowlist"}
-    
+        proc_name = psutil.Process(pid).name()
     except psutil.NoSuchProcess:
         return {"is_safe": False, "reason": "Process does not exist"}
     except psutil.AccessDenied:
         return {"is_safe": False, "reason": "Access denied"}
+    
+    return _check_safe_with_name(proc_name, require_allowlist)
+
 
+# Build the matcher for the startup allowlist up front
+_allowlist_matcher(config.PROCESS_KILL_ALLOWLIST)
 
 # Global rate limiter instance
 kill_rate_limiter = RateLimiter(config.PROCESS_KILL_RATE_LIMIT_PER_MIN)
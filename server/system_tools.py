@@ -1,4 +1,5 @@
 """System telemetry tools for CPU, memory, disk, and network statistics."""
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Any
 import psutil
 import time
@@ -6,11 +7,18 @@ import time
 from .schema import CPUStats, MemoryStats, DiskStats, NetworkStats
 from .process_tools import process_list
 
+# Prime the per-core counters so the first get_cpu() has a baseline
+psutil.cpu_percent(interval=None, percpu=True)
+
+# Mount tables change rarely; reuse the partition list for a few seconds
+_PARTITION_CACHE: Dict[str, Any] = {"ts": 0.0, "val": None}
+
 
 def get_cpu() -> Dict[str, Any]:
-    """Get CPU usage statistics."""
-    cpu_percent = psutil.cpu_percent(interval=0.1)
-    per_core = psutil.cpu_percent(interval=0.1, percpu=True)
+    """Get CPU usage statistics since the previous call (non-blocking)."""
+    per_core = psutil.cpu_percent(interval=None, percpu=True)
+    # Same sample as per_core; matches psutil's overall figure
+    cpu_percent = sum(per_core) / len(per_core) if per_core else 0.0
     
     return {
         "overall": cpu_percent,
@@ -28,19 +36,34 @@ def get_memory() -> Dict[str, Any]:
     }
 
 
+def _get_partitions(ttl: float = 5.0) -> List[Any]:
+    """Get mounted partitions, cached for ``ttl`` seconds."""
+    now = time.monotonic()
+    if _PARTITION_CACHE["val"] is not None and now - _PARTITION_CACHE["ts"] < ttl:
+        return _PARTITION_CACHE["val"]
+    
+    partitions = psutil.disk_partitions()
+    _PARTITION_CACHE["ts"] = now
+    _PARTITION_CACHE["val"] = partitions
+    return partitions
+
+
 def get_disk() -> List[Dict[str, Any]]:
     """Get disk usage for all mounted partitions."""
     disks = []
-    for partition in psutil.disk_partitions():
+    partitions = _get_partitions()
+    append = disks.append
+    for partition in partitions:
         try:
             usage = psutil.disk_usage(partition.mountpoint)
-            disks.append({
+            append({
                 "mount": partition.mountpoint,
                 "total": usage.total,
                 "used": usage.used,
                 "percent": usage.percent
             })
-        except PermissionError:
+        except OSError:
+            # Covers PermissionError as well as stale or vanished mounts
             continue
     return disks
 
@@ -68,27 +91,24 @@ def get_system_summary(window_s: int = 5, top_n: int = 3) -> Dict[str, Any]:
     window_s = max(1, min(60, window_s))
     top_n = max(1, min(10, top_n))
     
-    # Sample CPU and memory over the window
-    cpu_samples = []
-    mem_samples = []
-    
-    for _ in range(window_s):
-        cpu_samples.append(psutil.cpu_percent(interval=1))
-        mem_samples.append(psutil.virtual_memory().percent)
-    
-    avg_cpu = sum(cpu_samples) / len(cpu_samples)
-    avg_mem = sum(mem_samples) / len(mem_samples)
-    
-    # Get top processes
-    top_processes = process_list(sort_by="cpu", limit=top_n)
+    # Collect top processes and disks while the CPU window blocks
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        processes_future = executor.submit(process_list, sort_by="cpu", limit=top_n)
+        disks_future = executor.submit(get_disk)
+        
+        # cpu_percent averages over the whole interval internally
+        avg_cpu = psutil.cpu_percent(interval=window_s)
+        avg_mem = psutil.virtual_memory().percent
+        
+        top_processes = processes_future.result()
+        all_disks = disks_future.result()
     
     # Get high-usage disks (>80%)
-    all_disks = get_disk()
     high_usage_disks = [d for d in all_disks if d["percent"] > 80]
     
     return {
-        "avg_cpu_percent": round(avg_cpu, 2),
-        "mem_percent": round(avg_mem, 2),
+        "avg_cpu_percent": avg_cpu,
+        "mem_percent": avg_mem,
         "top_processes": top_processes,
         "high_usage_disks": high_usage_disks
     }
@@ -6,14 +6,18 @@ import sys
 import os
 import time
 
-# Add server directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'server'))
+import psutil
+import pytest
 
-from system_tools import get_cpu, get_memory, get_disk, get_network, get_system_summary
-from process_tools import process_list, _safe_join_cmdline
-from security import RateLimiter, process_is_safe
-from config import Config
-from schema import CPUStats, MemoryStats, DiskStats, NetworkStats, ProcessInfo
+# Add project root to path so the server package's relative imports resolve
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from server import _proc_fast, security
+from server.system_tools import get_cpu, get_memory, get_disk, get_network, get_system_summary
+from server.process_tools import process_list, _safe_join_cmdline
+from server.security import RateLimiter, process_is_safe
+from server.config import Config
+from server.schema import CPUStats, MemoryStats, DiskStats, NetworkStats, ProcessInfo
 
 
 # ========== System Tools Tests ==========
@@ -120,27 +124,150 @@ def test_safe_join_cmdline():
     assert _safe_join_cmdline(["ls", "-la", "/tmp"]) == "ls -la /tmp"
 
 
+def test_safe_join_cmdline_truncates():
+    """Test very long command lines are capped."""
+    joined = _safe_join_cmdline(["python"] + ["x" * 100] * 1000)
+    assert joined.startswith("python xxx")
+    assert joined.endswith("...")
+    assert len(joined) == 4096 + len("...")
+
+
+def test_safe_join_cmdline_truncates_at_boundary():
+    """Test the cap holds when the text so far ends exactly at or just under it."""
+    assert _safe_join_cmdline(["x" * 4096, "y" * 100000]) == "x" * 4096 + "..."
+    assert _safe_join_cmdline(["x" * 4095, "y" * 100000]) == "x" * 4095 + "..."
+    assert _safe_join_cmdline(["x" * 4094, "y" * 100000]) == "x" * 4094 + " y..."
+    assert _safe_join_cmdline(["y" * 100000]) == "y" * 4096 + "..."
+    assert _safe_join_cmdline(["x" * 4096]) == "x" * 4096
+
+
+def test_parse_proc_stat():
+    """Test /proc/<pid>/stat parsing with spaces and parentheses in the name."""
+    fields = " ".join(str(i) for i in range(4, 53))
+    comm, ticks, rss_pages = _proc_fast._parse_stat(f"42 (my (odd) proc) S {fields}\n".encode())
+    assert comm == "my (odd) proc"
+    assert ticks == 14 + 15  # utime + stime
+    assert rss_pages == 24
+
+
+@pytest.mark.skipif(not _proc_fast.AVAILABLE, reason="/proc fast path is Linux-only")
+def test_proc_fast_iter_processes():
+    """Test the /proc fast path reports the current process."""
+    import pwd
+    
+    current_pid = os.getpid()
+    procs = {info["pid"]: (info, read_cmdline) for info, read_cmdline in _proc_fast.iter_processes(interval=0.1)}
+    assert current_pid in procs
+    info, read_cmdline = procs[current_pid]
+    assert info["username"] == pwd.getpwuid(os.getuid()).pw_name
+    assert info["cpu_percent"] >= 0
+    assert info["memory_mb"] >= 0
+    assert read_cmdline()
+
+
+def test_process_list_psutil_path(monkeypatch):
+    """Test the psutil listing path used where /proc is unavailable."""
+    monkeypatch.setattr(_proc_fast, "AVAILABLE", False)
+    me = psutil.Process()
+    name, username = me.name(), me.username()
+    
+    procs = process_list(sort_by="pid", limit=100000, name_contains=name.upper(), user=username)
+    assert all(name.lower() in p["name"].lower() and p["username"] == username for p in procs)
+    
+    mine = next(p for p in procs if p["pid"] == os.getpid())
+    rss = me.memory_info().rss
+    assert abs(mine["memory_mb"] - (rss >> 20)) <= 8
+    assert 0 < mine["memory_percent"] <= 100
+    # cmdline is read after selection, for returned processes only
+    assert mine["cmdline"] == _safe_join_cmdline(me.cmdline())
+    
+    assert process_list(user="no-such-user-sysmcp", limit=100000) == []
+
+
+@pytest.mark.skipif(not _proc_fast.AVAILABLE, reason="/proc fast path is Linux-only")
+def test_process_list_paths_agree(monkeypatch):
+    """Test the /proc and psutil paths report the current process the same way."""
+    def find_me():
+        procs = process_list(sort_by="pid", limit=100000, user=psutil.Process().username())
+        return next(p for p in procs if p["pid"] == os.getpid())
+    
+    fast = find_me()
+    monkeypatch.setattr(_proc_fast, "AVAILABLE", False)
+    slow = find_me()
+    
+    assert fast["name"] == slow["name"]
+    assert fast["username"] == slow["username"]
+    assert abs(fast["memory_mb"] - slow["memory_mb"]) <= 8
+    assert fast["cmdline"] == slow["cmdline"]
+
+
 # ========== Security Tests ==========
 
-def test_rate_limiter():
+def test_rate_limiter(monkeypatch):
     """Test rate limiter functionality."""
-    limiter = RateLimiter(max_events_per_minute=3)
+    now = [1000.0]
+    monkeypatch.setattr(security.time, "monotonic", lambda: now[0])
+    limiter = RateLimiter(max_per_minute=3)
     
     # Should allow first 3 events
     assert limiter.allow() is True
     assert limiter.allow() is True
     assert limiter.allow() is True
     
-    # Should deny 4th event
+    # Should deny 4th event within the same minute
+    assert limiter.allow() is False
+    now[0] += 59.9
     assert limiter.allow() is False
     
-    # Check remaining
-    assert limiter.get_remaining() == 0
-    
-    # Reset and try again
-    limiter.reset()
+    # Oldest event leaves the window after 60s
+    now[0] = 1060.0
     assert limiter.allow() is True
-    assert limiter.get_remaining() == 2
+    assert limiter.allow() is True
+    assert limiter.allow() is True
+    assert limiter.allow() is False
+
+
+def test_rate_limiter_zero_limit():
+    """Test a zero limit always denies."""
+    limiter = RateLimiter(max_per_minute=0)
+    assert limiter.allow() is False
+    assert limiter.allow() is False
+
+
+@pytest.fixture
+def fresh_matcher_cache():
+    """Clear the cached allowlist matcher around a test that swaps its backend."""
+    security._allowlist_matcher.cache_clear()
+    yield
+    security._allowlist_matcher.cache_clear()
+
+
+def _check_matcher(matcher):
+    assert matcher("gcc++-12") is True  # substring hit; '+' matched literally
+    assert matcher("python3") is True
+    assert matcher("gcc") is False
+    assert matcher("pythn") is False
+
+
+def test_allowlist_matcher_regex_fallback(monkeypatch, fresh_matcher_cache):
+    """Test the regex matcher used when pyahocorasick is unavailable."""
+    monkeypatch.setattr(security, "ahocorasick", None)
+    _check_matcher(security._allowlist_matcher(frozenset({"c++", "python"})))
+    assert security._allowlist_matcher(frozenset())("python") is False
+    
+    # Runtime allowlist edits produce a new frozenset and so a rebuilt matcher
+    monkeypatch.setattr(security.config, "PROCESS_KILL_ALLOWLIST", security.config.PROCESS_KILL_ALLOWLIST)
+    assert security._check_safe_with_name("myeditor-bin")["is_safe"] is False
+    security.config.add_to_allowlist("MyEditor")
+    assert security._check_safe_with_name("myeditor-bin")["is_safe"] is True
+
+
+def test_allowlist_matcher_automaton(fresh_matcher_cache):
+    """Test the pyahocorasick matcher."""
+    pytest.importorskip("ahocorasick")
+    assert security.ahocorasick is not None
+    _check_matcher(security._allowlist_matcher(frozenset({"c++", "python"})))
+    assert security._allowlist_matcher(frozenset())("python") is False
 
 
 def test_process_is_safe():
@@ -148,19 +275,29 @@ def test_process_is_safe():
     # Test with current process (should exist)
     current_pid = os.getpid()
     result = process_is_safe(current_pid, require_allowlist=False)
-    assert "safe" in result
+    assert result["is_safe"] is True
     assert "reason" in result
-    assert "process_name" in result
     
-    # Test with invalid PID
-    result = process_is_safe(999999, require_allowlist=False)
-    assert result["safe"] is False
-    assert "No such process" in result["reason"]
+    # Test with a PID above the kernel's maximum (4194304), so it cannot exist
+    result = process_is_safe(4194305, require_allowlist=False)
+    assert result["is_safe"] is False
+    assert result["reason"] == "Process does not exist"
+
+
+def test_check_safe_with_name(monkeypatch):
+    """Test the name-based allowlist check used by the kill path."""
+    monkeypatch.setattr(security.config, "PROCESS_KILL_ALLOWLIST", frozenset({"python"}))
+    
+    # Case-folded substring match
+    result = security._check_safe_with_name("Python3")
+    assert result["is_safe"] is True
+    assert "'python3'" in result["reason"]
+    
+    assert security._check_safe_with_name("bash")["is_safe"] is False
     
-    # Test init process (PID 1) - should be unsafe
-    result = process_is_safe(1, require_allowlist=False)
-    assert result["safe"] is False
-    assert "init" in result["reason"].lower()
+    # Bypass skips the allowlist entirely
+    result = security._check_safe_with_name("bash", require_allowlist=False)
+    assert result == {"is_safe": True, "reason": "Allowlist check bypassed"}
 
 
 def test_config():
@@ -187,7 +324,7 @@ def test_config():
 # ========== Schema Tests ==========
 
 def test_cpu_stats_schema():
-    """Test CPUStats Pydantic model."""
+    """Test CPUStats model."""
     valid_data = {"overall": 50.5, "per_core": [45.0, 55.0, 48.5, 52.0]}
     cpu = CPUStats(**valid_data)
     assert cpu.overall == 50.5
@@ -195,7 +332,7 @@ def test_cpu_stats_schema():
 
 
 def test_memory_stats_schema():
-    """Test MemoryStats Pydantic model."""
+    """Test MemoryStats model."""
     valid_data = {"total": 16000000000, "used": 8000000000, "percent": 50.0}
     mem = MemoryStats(**valid_data)
     assert mem.total == 16000000000
@@ -203,7 +340,7 @@ def test_memory_stats_schema():
 
 
 def test_process_info_schema():
-    """Test ProcessInfo Pydantic model."""
+    """Test ProcessInfo model."""
     valid_data = {
         "pid": 1234,
         "name": "python",